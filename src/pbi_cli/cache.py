@@ -4,7 +4,7 @@ This module provides caching functionality for API call results,
 supporting both local and remote storage (e.g., S3) using cloudpathlib.
 
 The cache system:
-- Stores data in JSON format
+- Stores data in JSON format (encoded with orjson when it is installed)
 - Uses timestamp-based versioning (subfolders)
 - Supports both local and remote paths (S3, etc.)
 - Designed for extensibility and analysis
@@ -16,17 +16,78 @@ Example:
     >>> data = cache.load("workspaces", version="latest")
 """
 
+import hashlib
+import importlib.util
 import json
+import os
 import shutil
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from cloudpathlib import AnyPath, CloudPath
 from loguru import logger
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# zstandard is only imported when a compressed entry is written or read
+ZSTD_AVAILABLE = importlib.util.find_spec("zstandard") is not None
+
 __all__ = ["CacheManager", "CacheConfig"]
 
+# Format of version identifiers, which double as the save timestamp
+VERSION_FORMAT = "%Y%m%d_%H%M%S"
+
+# Supported values of CacheConfig.compression
+COMPRESSIONS = (None, "zstd")
+# Suffix appended to the cache file name for zstd-compressed entries
+ZSTD_SUFFIX = ".zst"
+# Suffix of the small state file kept next to a cache file. It holds the
+# data hash used by save(skip_unchanged=True) and when the data was last
+# confirmed unchanged.
+STATE_SUFFIX = ".state.json"
+
+
+def _dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize an object to UTF-8 JSON.
+
+    Uses orjson when installed and falls back to the standard library, also
+    for values orjson cannot encode, such as integers beyond 64 bits.
+
+    :param obj: Object to serialize
+    :param indent: Whether to indent the output, or write it compactly
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Deserialize UTF-8 JSON, using orjson when installed.
+
+    Falls back to the standard library for input orjson rejects, such as
+    the NaN and Infinity literals that json.dumps writes.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except json.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
 
 class CacheConfig:
     """Configuration for cache management.
@@ -35,6 +96,7 @@ class CacheConfig:
         cache_folder: Base folder for cache storage (local or remote path)
         enabled: Whether caching is enabled
         default_versioning: Whether to use timestamp versioning by default
+        compression: Compression for new cache files (None or "zstd")
     """
 
     def __init__(
@@ -42,16 +104,31 @@ class CacheConfig:
         cache_folder: Union[str, Path, CloudPath, None] = None,
         enabled: bool = True,
         default_versioning: bool = True,
+        compression: Optional[str] = None,
     ):
         """Initialize cache configuration.
 
         :param cache_folder: Base folder for cache storage
         :param enabled: Whether caching is enabled
         :param default_versioning: Whether to use timestamp versioning by default
+        :param compression: Compression for new cache files. None writes plain
+            JSON, "zstd" writes zstd-compressed JSON (requires zstandard)
         """
+        if compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unsupported compression: {compression}. "
+                f"Choose one of {COMPRESSIONS}."
+            )
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ImportError(
+                "zstd compression requires the zstandard package "
+                "(pip install 'pbi_cli[zstd]')"
+            )
+
         self.cache_folder = cache_folder
         self.enabled = enabled
         self.default_versioning = default_versioning
+        self.compression = compression
 
     @property
     def cache_path(self) -> Optional[AnyPath]:
@@ -113,6 +190,27 @@ class CacheManager:
             Path(str(path)).mkdir(parents=True, exist_ok=True)
         # For cloud paths, directories are created automatically on write
 
+    @staticmethod
+    def _list_subdirs(path: AnyPath) -> List[str]:
+        """List the names of the subdirectories of a cache folder.
+
+        Local folders are read with os.scandir, which takes the entry type from
+        the directory listing instead of calling stat on every entry.
+
+        :param path: Folder to list
+        :return: Names of the subdirectories, or an empty list if path doesn't exist
+        """
+        if isinstance(path, CloudPath):
+            if not path.exists():
+                return []
+            return [item.name for item in path.iterdir() if item.is_dir()]
+
+        try:
+            with os.scandir(str(path)) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            return []
+
     def _get_version_timestamp(self) -> str:
         """Generate a timestamp string for versioning.
 
@@ -121,7 +219,95 @@ class CacheManager:
 
         :return: Timestamp string in YYYYMMDD_HHMMSS format
         """
-        return datetime.now().strftime("%Y%m%d_%H%M%S")
+        return datetime.now().strftime(VERSION_FORMAT)
+
+    @staticmethod
+    def _is_timestamp_version(version: str) -> bool:
+        """Check whether a version identifier is a YYYYMMDD_HHMMSS timestamp.
+
+        :param version: Version identifier
+        :return: True if the identifier has the timestamp layout
+        """
+        digits = version[:8] + version[9:]
+        return (
+            len(version) == 15
+            and version[8] == "_"
+            and digits.isascii()
+            and digits.isdigit()
+        )
+
+    @staticmethod
+    def _version_cutoff(max_age: timedelta) -> str:
+        """Get the version identifier of the oldest moment within max_age.
+
+        Timestamp versions are fixed-width and zero-padded, so they order
+        chronologically as plain strings and can be compared to this cutoff
+        without parsing.
+
+        :param max_age: Maximum age
+        :return: Cutoff in YYYYMMDD_HHMMSS format, or an empty string if max_age
+            reaches back before the earliest representable date
+        """
+        try:
+            return (datetime.now() - max_age).strftime(VERSION_FORMAT)
+        except OverflowError:
+            # Every version is younger than such a max_age
+            return ""
+
+    @classmethod
+    def _is_version_fresh(cls, version: str, max_age: timedelta) -> bool:
+        """Check whether a version is younger than max_age.
+
+        Versions are timestamps, so the age is read from the identifier itself.
+
+        :param version: Version identifier in YYYYMMDD_HHMMSS format
+        :param max_age: Maximum age of the version
+        :return: True if the version is younger than max_age, False otherwise
+            (including for identifiers that are not timestamps)
+        """
+        return cls._is_timestamp_version(version) and version > cls._version_cutoff(
+            max_age
+        )
+
+    def _is_entry_fresh(self, cache_key: str, version: str, max_age: timedelta) -> bool:
+        """Check whether a cached version was saved or confirmed within max_age.
+
+        The version folder name is checked first. Only if it is too old is the
+        small state file read, to see whether the data was confirmed unchanged
+        by a later save(skip_unchanged=True).
+
+        :param cache_key: Key identifying the cached data
+        :param version: Version identifier
+        :param max_age: Maximum age of the version
+        :return: True if the version was saved or confirmed within max_age
+        """
+        if self._is_version_fresh(version, max_age):
+            return True
+
+        confirmed_at = self._read_state(cache_key, version).get("confirmed_at")
+        if confirmed_at is None:
+            return False
+        try:
+            return datetime.now() - datetime.fromisoformat(confirmed_at) < max_age
+        except (TypeError, ValueError):
+            logger.warning(
+                f"Ignoring invalid confirmed_at in cache state of {cache_key} "
+                f"version {version}: {confirmed_at!r}"
+            )
+            return False
+
+    def is_fresh(self, cache_key: str, max_age: timedelta) -> bool:
+        """Check whether the latest version of a cache key is recent enough.
+
+        The age is derived from the version folder name, so the cache file
+        itself is never opened or decoded.
+
+        :param cache_key: Key identifying the cached data
+        :param max_age: Maximum age of the latest version
+        :return: True if the latest version was saved or confirmed within max_age
+        """
+        versions = self.list_versions(cache_key)
+        return bool(versions) and self._is_entry_fresh(cache_key, versions[0], max_age)
 
     def _get_cache_path(
         self,
@@ -153,12 +339,71 @@ class CacheManager:
 
         return cache_file
 
+    @staticmethod
+    def _find_cache_file(cache_path: AnyPath) -> Optional[AnyPath]:
+        """Find the plain or zstd-compressed file stored for a cache path.
+
+        :param cache_path: Path of the uncompressed cache file
+        :return: Path of the existing cache file, or None if neither exists
+        """
+        if cache_path.exists():
+            return cache_path
+
+        compressed_path = cache_path.parent / (cache_path.name + ZSTD_SUFFIX)
+        if compressed_path.exists():
+            return compressed_path
+
+        return None
+
+    def _get_state_path(self, cache_key: str, version: str) -> AnyPath:
+        """Get the path of the state file of a cached version.
+
+        :param cache_key: Key identifying the cached data
+        :param version: Version identifier
+        :return: Path to the state file
+        """
+        return self._base_path / cache_key / version / f"{cache_key}{STATE_SUFFIX}"
+
+    def _read_state(self, cache_key: str, version: str) -> Dict[str, Any]:
+        """Read the state file of a cached version.
+
+        :param cache_key: Key identifying the cached data
+        :param version: Version identifier
+        :return: State dictionary, or an empty dictionary if there is none or
+            it cannot be read
+        """
+        state_path = self._get_state_path(cache_key, version)
+        try:
+            if not state_path.exists():
+                return {}
+            with state_path.open("rb") as f:
+                state = _loads(f.read())
+        except Exception as e:
+            logger.warning(f"Failed to read cache state {state_path}: {e}")
+            return {}
+
+        if not isinstance(state, dict):
+            logger.warning(f"Ignoring invalid cache state {state_path}")
+            return {}
+        return state
+
+    def _write_state(self, cache_key: str, version: str, state: Dict[str, Any]):
+        """Write the state file of a cached version.
+
+        :param cache_key: Key identifying the cached data
+        :param version: Version identifier
+        :param state: State dictionary
+        """
+        with self._get_state_path(cache_key, version).open("wb") as f:
+            f.write(_dumps(state))
+
     def save(
         self,
         cache_key: str,
         data: Any,
         version: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        skip_unchanged: bool = False,
     ) -> Optional[str]:
         """Save data to cache with optional versioning.
 
@@ -166,6 +411,12 @@ class CacheManager:
         :param data: Data to cache (must be JSON serializable)
         :param version: Optional version identifier (auto-generated if None)
         :param metadata: Optional metadata to include in cache
+        :param skip_unchanged: Whether to skip writing a new version when data and
+            metadata are identical to the latest version. A hash of the compact
+            JSON encoding of the data is kept in a small state file next to the
+            entry, so the previous data never has to be read. When the data is
+            unchanged, the latest version is marked as confirmed now, which
+            counts towards its freshness.
         :return: Version identifier used, or None if cache is disabled/not configured
         """
         if not self.config.enabled or self._base_path is None:
@@ -173,6 +424,29 @@ class CacheManager:
             return None
 
         try:
+            state = None
+            if skip_unchanged:
+                state = {
+                    "data_hash": hashlib.blake2b(
+                        _dumps(data, indent=False), digest_size=16
+                    ).hexdigest(),
+                    "metadata": metadata or {},
+                }
+                versions = self.list_versions(cache_key)
+                if versions:
+                    latest_state = self._read_state(cache_key, versions[0])
+                    if (
+                        latest_state.get("data_hash") == state["data_hash"]
+                        and latest_state.get("metadata") == state["metadata"]
+                    ):
+                        latest_state["confirmed_at"] = datetime.now().isoformat()
+                        self._write_state(cache_key, versions[0], latest_state)
+                        logger.info(
+                            f"Data for {cache_key} unchanged since version "
+                            f"{versions[0]}, skipping cache write"
+                        )
+                        return versions[0]
+
             cache_path = self._get_cache_path(cache_key, version, create_version=True)
             if cache_path is None:
                 return None
@@ -197,9 +471,18 @@ class CacheManager:
             # Ensure directory exists
             self._ensure_cache_dir(cache_path.parent)
 
+            content = _dumps(cache_data)
+            if self.config.compression == "zstd":
+                import zstandard
+
+                content = zstandard.ZstdCompressor(level=3).compress(content)
+                cache_path = cache_path.parent / (cache_path.name + ZSTD_SUFFIX)
+
             # Write cache file
-            with cache_path.open("w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            with cache_path.open("wb") as f:
+                f.write(content)
+            if state is not None:
+                self._write_state(cache_key, used_version, state)
 
             logger.info(f"Cached data to {cache_path}")
             return used_version
@@ -209,12 +492,21 @@ class CacheManager:
             return None
 
     def load(
-        self, cache_key: str, version: Optional[str] = "latest"
+        self,
+        cache_key: str,
+        version: Optional[str] = "latest",
+        max_age: Optional[timedelta] = None,
+        include_confirmed_at: bool = False,
     ) -> Optional[Dict[str, Any]]:
         """Load data from cache.
 
         :param cache_key: Key identifying the cached data
         :param version: Version to load ("latest" for most recent, None for non-versioned)
+        :param max_age: Optional maximum age of the latest version; older
+            entries are treated as missing without reading the cache file
+        :param include_confirmed_at: Whether to read the state file and add
+            "confirmed_at", the time unchanged data was last confirmed by
+            save(skip_unchanged=True), when there is one
         :return: Cached data dictionary or None if not found
         """
         if not self.config.enabled or self._base_path is None:
@@ -230,14 +522,42 @@ class CacheManager:
                     return None
                 version = versions[0]  # Most recent version
 
+                if max_age is not None and not self._is_entry_fresh(
+                    cache_key, version, max_age
+                ):
+                    logger.debug(f"Cached version {version} of {cache_key} expired")
+                    return None
+
             cache_path = self._get_cache_path(cache_key, version)
-            if cache_path is None or not cache_path.exists():
+            cache_file = (
+                None if cache_path is None else self._find_cache_file(cache_path)
+            )
+            if cache_file is None:
                 logger.debug(f"Cache file not found: {cache_path}")
                 return None
+            is_compressed = cache_file.name.endswith(ZSTD_SUFFIX)
+            if is_compressed and not ZSTD_AVAILABLE:
+                logger.error(
+                    f"zstandard is required to read {cache_file} "
+                    "(pip install 'pbi_cli[zstd]')"
+                )
+                return None
 
             # Read cache file
-            with cache_path.open("r", encoding="utf-8") as f:
-                cache_data = json.load(f)
+            with cache_file.open("rb") as f:
+                content = f.read()
+            if is_compressed:
+                import zstandard
+
+                content = zstandard.ZstdDecompressor().decompress(content)
+            cache_data = _loads(content)
+            cache_path = cache_file
+
+            if include_confirmed_at and version:
+                # Report when unchanged data was last confirmed by a re-fetch
+                confirmed_at = self._read_state(cache_key, version).get("confirmed_at")
+                if confirmed_at is not None:
+                    cache_data["confirmed_at"] = confirmed_at
 
             logger.info(f"Loaded cache from {cache_path}")
             return cache_data
@@ -249,7 +569,8 @@ class CacheManager:
     def list_versions(self, cache_key: str) -> List[str]:
         """List all available versions for a cache key.
 
-        Versions are returned in descending order (most recent first).
+        Timestamp versions are returned first, in descending order (most
+        recent first), followed by any versions whose names are not timestamps.
 
         :param cache_key: Key identifying the cached data
         :return: List of version identifiers
@@ -259,21 +580,22 @@ class CacheManager:
 
         try:
             cache_dir = self._base_path / cache_key
-
-            if not cache_dir.exists():
-                return []
-
-            # List all subdirectories (versions)
-            versions = []
-            for item in cache_dir.iterdir():
-                if item.is_dir():
-                    # Check if this directory contains the cache file
-                    cache_file = item / f"{cache_key}.json"
-                    if cache_file.exists():
-                        versions.append(item.name)
-
-            # Sort versions in descending order (most recent first)
-            return sorted(versions, reverse=True)
+            cache_file_name = f"{cache_key}.json"
+
+            # Version folders that contain the cache file
+            versions = [
+                version
+                for version in self._list_subdirs(cache_dir)
+                if self._find_cache_file(cache_dir / version / cache_file_name)
+            ]
+
+            # Sort timestamp versions in descending order (most recent first),
+            # ahead of names that are not timestamps
+            return sorted(
+                versions,
+                key=lambda version: (self._is_timestamp_version(version), version),
+                reverse=True,
+            )
 
         except Exception as e:
             logger.warning(f"Failed to list versions for {cache_key}: {e}")
@@ -288,16 +610,12 @@ class CacheManager:
             return []
 
         try:
-            if not self._base_path.exists():
-                return []
-
-            keys = []
-            for item in self._base_path.iterdir():
-                if item.is_dir():
-                    # Check if this is a cache key directory
-                    versions = self.list_versions(item.name)
-                    if versions:
-                        keys.append(item.name)
+            # Cache key folders that contain at least one version
+            keys = [
+                key
+                for key in self._list_subdirs(self._base_path)
+                if self.list_versions(key)
+            ]
 
             return sorted(keys)
 
@@ -343,9 +661,64 @@ class CacheManager:
             else:
                 # Clear specific version
                 cache_path = self._get_cache_path(cache_key, version)
-                if cache_path and cache_path.exists():
-                    cache_path.unlink()
+                cache_file = cache_path and self._find_cache_file(cache_path)
+                if cache_file:
+                    cache_file.unlink()
+                    state_path = self._get_state_path(cache_key, version)
+                    if state_path.exists():
+                        state_path.unlink()
                     logger.info(f"Cleared {cache_key} version {version}")
 
         except Exception as e:
             logger.error(f"Failed to clear cache: {e}")
+
+    def prune(
+        self,
+        max_age: timedelta,
+        cache_key: Optional[str] = None,
+        keep_latest: bool = True,
+    ) -> int:
+        """Remove cached versions older than max_age.
+
+        Versions are timestamps, so expired versions are found from the folder
+        names alone. Versions whose names are not timestamps are left untouched.
+
+        :param max_age: Maximum age of the versions to keep
+        :param cache_key: Specific cache key to prune (prunes all keys if None)
+        :param keep_latest: Whether to always keep the most recent timestamp
+            version of a key
+        :return: Number of versions removed
+        """
+        if self._base_path is None:
+            logger.warning("Cache path not configured")
+            return 0
+
+        cache_keys = [cache_key] if cache_key is not None else self.list_keys()
+        cutoff = self._version_cutoff(max_age)
+        removed = 0
+
+        for key in cache_keys:
+            # Timestamp versions come first, most recent first
+            versions = self.list_versions(key)
+            if keep_latest:
+                versions = versions[1:]
+
+            for version in versions:
+                if not self._is_timestamp_version(version) or version > cutoff:
+                    continue
+                # Old versions that were recently confirmed unchanged are kept
+                if self._is_entry_fresh(key, version, max_age):
+                    continue
+
+                try:
+                    version_dir = self._base_path / key / version
+                    if isinstance(version_dir, CloudPath):
+                        version_dir.rmtree()
+                    else:
+                        shutil.rmtree(str(version_dir))
+                    removed += 1
+                except Exception as e:
+                    logger.warning(f"Failed to remove {key} version {version}: {e}")
+
+        logger.info(f"Pruned {removed} expired cache version(s)")
+        return removed
@@ -1,13 +1,13 @@
+import functools
 import json
 import os
 import sys
+from datetime import timedelta
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, Optional, Union
 
 import click
-import pandas as pd
 from loguru import logger
-from slugify import slugify
 
 import pbi_cli.powerbi.admin as powerbi_admin
 import pbi_cli.powerbi.admin.report as powerbi_admin_report
@@ -50,6 +50,8 @@ AUTH_CONFIG_FILE = CONFIG_DIR / "auth.json"
 LEGACY_PROFILES_FILE = CONFIG_DIR / "profiles.json"
 CREDENTIALS_FILE = CONFIG_DIR / "credentials.json"
 KEYRING_SERVICE = "pbi-cli"
+# Horizontal rule framing console tables
+_SEPARATOR = "=" * 80
 
 
 def _get_config_dir() -> Path:
@@ -80,11 +82,16 @@ def _handle_cache_load(
 
     if pbi_config.cache_folder and pbi_config.cache_enabled:
         cache_manager = CacheManager(cache_folder=pbi_config.cache_folder)
-        cached_data = cache_manager.load(cache_key, version="latest")
+        cached_data = cache_manager.load(
+            cache_key, version="latest", include_confirmed_at=True
+        )
 
         if cached_data:
             cache_version = cached_data.get("version", "unknown")
-            cache_time = cached_data.get("cached_at", "unknown")
+            # Unchanged data re-fetched later is reported with its confirmation time
+            cache_time = cached_data.get(
+                "confirmed_at", cached_data.get("cached_at", "unknown")
+            )
             click.secho(
                 f"Using cached data from {cache_time} (version: {cache_version})",
                 fg="cyan",
@@ -114,11 +121,34 @@ def _handle_cache_save(
     """Save data to cache if configured and enabled."""
     if pbi_config.cache_folder and pbi_config.cache_enabled:
         cache_manager = CacheManager(cache_folder=pbi_config.cache_folder)
-        version = cache_manager.save(cache_key, data, metadata=metadata)
+        version = cache_manager.save(
+            cache_key, data, metadata=metadata, skip_unchanged=True
+        )
         if version:
             click.secho(f"Cached data (version: {version})", fg="green")
 
 
+def _prepare_target_folder(target_folder: str) -> Path:
+    """Resolve a --target-folder value and make sure the folder exists.
+
+    Raises click.Abort if the folder cannot be resolved.
+    """
+    target_path = resolve_output_path(target_folder)
+
+    # Check if path resolution failed
+    if target_path is None:
+        click.secho("Error: Unable to determine output folder.", fg="red")
+        click.echo("Use 'pbi config set-output-folder' to set a default output folder,")
+        click.echo("or provide an absolute path with --target-folder.")
+        raise click.Abort()
+
+    if not target_path.exists():
+        click.secho(f"creating folder {target_path}", fg="blue")
+        target_path.mkdir(parents=True, exist_ok=True)
+
+    return target_path
+
+
 def _display_table(
     data: Dict[str, Any], title: str, display_cols: Optional[list] = None
 ):
@@ -129,27 +159,50 @@ def _display_table(
         title: Title to display above the table
         display_cols: Optional list of column names to display
     """
+    import pandas as pd
+
     if not data or "value" not in data or len(data["value"]) == 0:
         click.echo(f"No {title.lower()} found.")
         return
 
-    df = pd.json_normalize(data["value"])
+    df = None
 
-    # Filter to display columns if specified
+    # Filter to display columns if specified. Records are projected before
+    # flattening so that large nested payloads (e.g. expanded users/reports)
+    # are never normalized only to be dropped again.
     if display_cols:
-        available_cols = [col for col in display_cols if col in df.columns]
+        projected = pd.json_normalize(
+            [{col: r[col] for col in display_cols if col in r} for r in data["value"]]
+        )
+        available_cols = [col for col in display_cols if col in projected.columns]
         if available_cols:
-            df = df[available_cols]
+            df = projected[available_cols]
 
-    click.echo("\n" + "=" * 80)
-    click.echo(f"{title}: {len(df)} record(s)")
-    click.echo("=" * 80)
-    click.echo(df.to_string(index=False))
-    click.echo("=" * 80)
+    if df is None:
+        df = pd.json_normalize(data["value"])
 
+    # Build the whole block first so it is written to the terminal at once
+    click.echo(
+        "\n".join(
+            [
+                "",
+                _SEPARATOR,
+                f"{title}: {len(df)} record(s)",
+                _SEPARATOR,
+                df.to_string(index=False),
+                _SEPARATOR,
+            ]
+        )
+    )
 
+
+@functools.lru_cache(maxsize=1)
 def _check_keyring_availability():
-    """Check if keyring is available and working"""
+    """Check if keyring is available and working
+
+    The result is cached for the lifetime of the process, since probing the
+    backend costs a full keyring round trip.
+    """
     if not KEYRING_AVAILABLE:
         return False
     try:
@@ -297,8 +350,12 @@ def _load_profiles() -> dict:
 def _save_profiles(profiles_data: dict):
     """Save profiles configuration to YAML config"""
     pbi_config = PBIConfig()
-    pbi_config.active_profile = profiles_data.get("active_profile")
-    pbi_config.profiles = profiles_data.get("profiles", {})
+    pbi_config.update(
+        {
+            "active_profile": profiles_data.get("active_profile"),
+            "profiles": profiles_data.get("profiles", {}),
+        }
+    )
 
 
 def _load_group_profiles(group: str) -> dict:
@@ -541,12 +598,9 @@ def switch_profile_cmd(profile_name: Optional[str] = None, group: Optional[str]
 
         if profile_name is None:
             click.echo(f"Available profiles in group '{group}':")
+            group_active = pbi_config.get_group_active_profile(group)
             for idx, prof in enumerate(available_profiles, 1):
-                active_marker = (
-                    " (active)"
-                    if prof == pbi_config.get_group_active_profile(group)
-                    else ""
-                )
+                active_marker = " (active)" if prof == group_active else ""
                 click.echo(f"  {idx}. {prof}{active_marker}")
 
             choice = click.prompt(
@@ -646,9 +700,11 @@ def list_auth():
 
     # Show group profiles
     click.echo()
+    has_group_profiles = False
     for group in VALID_GROUPS:
         group_profiles = pbi_config.get_group_profiles(group)
         group_active = pbi_config.get_group_active_profile(group)
+        has_group_profiles = has_group_profiles or bool(group_profiles)
         if group_profiles:
             click.echo(f"Group '{group}':")
             for profile_name in group_profiles.keys():
@@ -664,7 +720,7 @@ def list_auth():
                 fg="yellow",
             )
 
-    if not profiles and not any(pbi_config.get_group_profiles(g) for g in VALID_GROUPS):
+    if not profiles and not has_group_profiles:
         click.secho(
             "No profiles found. Use 'pbi auth' to create a profile.", fg="yellow"
         )
@@ -1032,6 +1088,52 @@ def clear_cache(cache_key: Optional[str] = None, version: Optional[str] = None):
         click.secho("✓ Cleared entire cache", fg="green")
 
 
+@cache_group.command(name="prune")
+@click.option(
+    "--older-than",
+    "-o",
+    type=click.FloatRange(min=0, min_open=True, max=timedelta.max.days),
+    help="Remove versions older than this many days",
+    required=True,
+)
+@click.option(
+    "--cache-key",
+    "-k",
+    help="Prune specific cache key (prunes all if omitted)",
+    default=None,
+)
+@click.confirmation_option(prompt="Are you sure you want to prune the cache?")
+def prune_cache(older_than: float, cache_key: Optional[str] = None):
+    """Remove old cached versions
+
+    The most recent version of each cache key is always kept. Versions
+    whose names are not timestamps are never removed.
+
+    ```
+    # Remove versions older than 30 days
+    pbi cache prune --older-than 30
+
+    # Only prune a specific cache key
+    pbi cache prune --older-than 7 -k workspaces
+    ```
+
+    :param older_than: Age in days beyond which versions are removed
+    :param cache_key: Optional cache key to prune
+    """
+    pbi_config = PBIConfig()
+    cache_folder = pbi_config.cache_folder
+
+    if not cache_folder:
+        click.secho("Cache folder not configured.", fg="yellow")
+        click.echo("Use 'pbi config set-cache-folder' to set one.")
+        return
+
+    cache_manager = CacheManager(cache_folder=cache_folder)
+    removed = cache_manager.prune(timedelta(days=older_than), cache_key=cache_key)
+
+    click.secho(f"✓ Removed {removed} cached version(s)", fg="green")
+
+
 @pbi.command()
 @click.option("--group-id", "-g", help="Group ID", required=True)
 @click.option("--report-id", "-r", help="Report ID", required=True)
@@ -1054,13 +1156,13 @@ def export(group_id: str, report_id: str, target: Optional[Path]):
     if target is None:
         # For binary export data, we can't print it directly to console
         # Instead, show information about the export
-        click.echo("\n" + "=" * 80)
+        click.echo("\n" + _SEPARATOR)
         click.echo(f"Report Export (Group: {group_id}, Report: {report_id})")
-        click.echo("=" * 80)
+        click.echo(_SEPARATOR)
         click.echo(f"Content size: {len(result.content)} bytes")
         click.echo(f"Content type: {result.headers.get('content-type', 'unknown')}")
         click.echo("\nUse --target option to save the export to a file.")
-        click.echo("=" * 80)
+        click.echo(_SEPARATOR)
     else:
         with open(target, "wb") as fp:
             fp.write(result.content)
@@ -1192,18 +1294,7 @@ def list(
         return
 
     # Resolve the target folder path (handles absolute/relative paths)
-    target_path = resolve_output_path(target_folder)
-
-    # Check if path resolution failed
-    if target_path is None:
-        click.secho("Error: Unable to determine output folder.", fg="red")
-        click.echo("Use 'pbi config set-output-folder' to set a default output folder,")
-        click.echo("or provide an absolute path with --target-folder.")
-        raise click.Abort()
-
-    if not target_path.exists():
-        click.secho(f"creating folder {target_path}", fg="blue")
-        target_path.mkdir(parents=True, exist_ok=True)
+    target_path = _prepare_target_folder(target_folder)
 
     if "json" in file_type:
         json_file_path = target_path / f"{file_name}.json"
@@ -1364,6 +1455,8 @@ def report_users(
 
     # If no target folder provided, print to console as a table
     if target_folder is None:
+        import pandas as pd
+
         if report_users and len(report_users) > 0:
             try:
                 # Flatten the structure for better table display
@@ -1385,11 +1478,18 @@ def report_users(
 
                 if all_reports:
                     df = pd.DataFrame(all_reports)
-                    click.echo("\n" + "=" * 80)
-                    click.echo(f"Found {len(all_reports)} report(s) across workspaces")
-                    click.echo("=" * 80)
-                    click.echo(df.to_string(index=False))
-                    click.echo("=" * 80)
+                    click.echo(
+                        "\n".join(
+                            [
+                                "",
+                                _SEPARATOR,
+                                f"Found {len(all_reports)} report(s) across workspaces",
+                                _SEPARATOR,
+                                df.to_string(index=False),
+                                _SEPARATOR,
+                            ]
+                        )
+                    )
                 else:
                     click.echo("No reports found.")
             except Exception as e:
@@ -1400,18 +1500,7 @@ def report_users(
         return
 
     # Resolve the target folder path (handles absolute/relative paths)
-    target_path = resolve_output_path(target_folder)
-
-    # Check if path resolution failed
-    if target_path is None:
-        click.secho("Error: Unable to determine output folder.", fg="red")
-        click.echo("Use 'pbi config set-output-folder' to set a default output folder,")
-        click.echo("or provide an absolute path with --target-folder.")
-        raise click.Abort()
-
-    if not target_path.exists():
-        click.secho(f"creating folder {target_path}", fg="blue")
-        target_path.mkdir(parents=True, exist_ok=True)
+    target_path = _prepare_target_folder(target_folder)
 
     click.secho(f"Writing results to the folder {target_path}")
     if "json" in file_type:
@@ -1485,11 +1574,15 @@ def user_access(
     cache_only: bool = False,
 ):
     """Get user access information from Power BI API"""
+    import pandas as pd
+    from slugify import slugify
+
+    user_slug = slugify(user_id)
     if file_name is None:
-        file_name = slugify(user_id)
+        file_name = user_slug
 
     pbi_config = PBIConfig()
-    cache_key = f"user_access_{slugify(user_id)}"
+    cache_key = f"user_access_{user_slug}"
 
     # Try to load from cache
     result = _handle_cache_load(cache_key, use_cache, cache_only, pbi_config)
@@ -1508,41 +1601,37 @@ def user_access(
         if isinstance(result, dict):
             try:
                 df = pd.json_normalize(result)
-                click.echo("\n" + "=" * 80)
-                click.echo(f"User Access Information for: {user_id}")
-                click.echo("=" * 80)
-                click.echo(df.to_string(index=False))
-                click.echo("=" * 80)
+                click.echo(
+                    "\n".join(
+                        [
+                            "",
+                            _SEPARATOR,
+                            f"User Access Information for: {user_id}",
+                            _SEPARATOR,
+                            df.to_string(index=False),
+                            _SEPARATOR,
+                        ]
+                    )
+                )
             except Exception:
                 click.echo(json.dumps(result, indent=4))
         else:
             click.echo(json.dumps(result, indent=4))
         return
-        # Resolve the target folder path
-        target_path = resolve_output_path(target_folder)
 
-        if target_path is None:
-            click.secho("Error: Unable to determine output folder.", fg="red")
-            click.echo(
-                "Use 'pbi config set-output-folder' to set a default output folder,"
-            )
-            click.echo("or provide an absolute path with --target-folder.")
-            raise click.Abort()
-
-        if not target_path.exists():
-            click.secho(f"creating folder {target_path}", fg="blue")
-            target_path.mkdir(parents=True, exist_ok=True)
+    # Resolve the target folder path
+    target_path = _prepare_target_folder(target_folder)
 
-        if "json" in file_types:
-            json_file_path = target_path / f"{file_name}.json"
-            logger.info(f"Writing json file to {json_file_path}...")
-            with open(json_file_path, "w") as fp:
-                json.dump(result, fp)
-        if "excel" in file_types:
-            excel_file_path = target_path / f"{file_name}.xlsx"
-            logger.info(f"Writing excel file to {excel_file_path}...")
-            df = pd.json_normalize(result)
-            df.to_excel(excel_file_path)
+    if "json" in file_types:
+        json_file_path = target_path / f"{file_name}.json"
+        logger.info(f"Writing json file to {json_file_path}...")
+        with open(json_file_path, "w") as fp:
+            json.dump(result, fp)
+    if "excel" in file_types:
+        excel_file_path = target_path / f"{file_name}.xlsx"
+        logger.info(f"Writing excel file to {excel_file_path}...")
+        df = pd.json_normalize(result)
+        df.to_excel(excel_file_path)
 
 
 @pbi.group(invoke_without_command=True)
@@ -1594,6 +1683,8 @@ def list(
     cache_only: bool = False,
 ):
     """List Power BI Apps and save them to files or print to console"""
+    import pandas as pd
+
     pbi_config = PBIConfig()
     cache_key = f"apps_{role}"
 
@@ -1619,18 +1710,7 @@ def list(
         return
 
     # Resolve the target folder path
-    target_path = resolve_output_path(target_folder)
-
-    # Check if path resolution failed
-    if target_path is None:
-        click.secho("Error: Unable to determine output folder.", fg="red")
-        click.echo("Use 'pbi config set-output-folder' to set a default output folder,")
-        click.echo("or provide an absolute path with --target-folder.")
-        raise click.Abort()
-
-    if not target_path.exists():
-        click.secho(f"creating folder {target_path}", fg="blue")
-        target_path.mkdir(parents=True, exist_ok=True)
+    target_path = _prepare_target_folder(target_folder)
 
     if "json" in file_type:
         json_file_path = target_path / f"{file_name}.json"
@@ -1667,11 +1747,11 @@ def app(app_id: str, target: Optional[Path], file_type: str = "json"):
 
     if target is None:
         # Print to console
-        click.echo("\n" + "=" * 80)
+        click.echo("\n" + _SEPARATOR)
         click.echo(f"App: {app_data.get('name', 'N/A')} (ID: {app_id})")
-        click.echo("=" * 80)
+        click.echo(_SEPARATOR)
         click.echo(json.dumps(app_data, indent=2))
-        click.echo("=" * 80)
+        click.echo(_SEPARATOR)
     else:
         # Save to file
         if file_type == "json":
@@ -1839,12 +1919,12 @@ def export(group_id: str, report_id: str, target: Optional[Path]):
     if target is None:
         # For binary export data, we can't print it directly to console
         # Instead, show information about the export
-        click.echo("\n" + "=" * 80)
+        click.echo("\n" + _SEPARATOR)
         click.echo(f"Report Export (Group: {group_id}, Report: {report_id})")
-        click.echo("=" * 80)
+        click.echo(_SEPARATOR)
         click.echo(f"Content size: {len(result)} bytes")
         click.echo("\nUse --target option to save the export to a file.")
-        click.echo("=" * 80)
+        click.echo(_SEPARATOR)
     else:
         with open(target, "wb") as fp:
             fp.write(result)
@@ -1,8 +1,10 @@
 """Configuration management for pbi-cli using YAML."""
 
+import copy
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 from loguru import logger
@@ -28,6 +30,24 @@ def _default_config_file() -> Path:
     return _default_config_dir() / "config.yaml"
 
 
+def _sanitize_local_path(value: str) -> str:
+    """Turn a local folder given on the command line into an absolute path.
+
+    Strips surrounding shell quotes, including a trailing quote left over from
+    an escaped ``\\"`` at the end of a Windows path, expands ``~`` and makes
+    the path absolute.
+
+    :param value: Raw folder path
+    :return: Absolute folder path
+    """
+    # Most values are already clean paths, which only need abspath
+    if "~" in value or '"' in value or "'" in value:
+        value = os.path.expanduser(value.strip("\"'"))
+
+    # os.path works on the string directly, without building a Path
+    return os.path.abspath(value)
+
+
 # Module-level constants retained for backward compatibility (import-time values)
 CONFIG_DIR = Path.home() / ".pbi_cli"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
@@ -35,6 +55,10 @@ CONFIG_FILE = CONFIG_DIR / "config.yaml"
 LEGACY_AUTH_CONFIG_FILE = CONFIG_DIR / "auth.json"
 LEGACY_PROFILES_FILE = CONFIG_DIR / "profiles.json"
 
+# Parsed config files keyed by path, together with the (mtime, size) they were
+# parsed at, so that PBIConfig instances within one process share a single parse
+_PARSED_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, int], dict]] = {}
+
 
 class PBIConfig:
     """Configuration manager for pbi-cli.
@@ -70,8 +94,16 @@ class PBIConfig:
 
         Returns default config if file doesn't exist.
         """
-        if not self._config_file.exists():
+        try:
+            stat = self._config_file.stat()
+        except OSError:
             return self._get_default_config()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        # Reuse the parsed file if it hasn't changed since it was last read
+        cached = _PARSED_CONFIG_CACHE.get(self._config_file)
+        if cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
 
         try:
             with open(self._config_file, "r", encoding="utf-8") as fp:
@@ -79,7 +111,8 @@ class PBIConfig:
                 # Only return default if config is None (empty file) or not a dict
                 if config is None or not isinstance(config, dict):
                     return self._get_default_config()
-                return config
+                _PARSED_CONFIG_CACHE[self._config_file] = (signature, config)
+                return copy.deepcopy(config)
         except Exception as e:
             logger.warning(f"Could not load config from {self._config_file}: {e}")
             return self._get_default_config()
@@ -90,6 +123,7 @@ class PBIConfig:
         with open(self._config_file, "w", encoding="utf-8") as fp:
             yaml.dump(config, fp, default_flow_style=False, sort_keys=False)
         self._data = None  # Invalidate cache
+        _PARSED_CONFIG_CACHE.pop(self._config_file, None)
 
     @staticmethod
     def _get_default_config() -> dict:
@@ -146,23 +180,33 @@ class PBIConfig:
         :param key: Configuration key (supports nested keys with dot notation)
         :param value: Value to set
         """
+        self.update({key: value})
+
+    def update(self, values: Dict[str, Any]):
+        """Set several configuration values with a single write.
+
+        :param values: Mapping of configuration keys (supports nested keys
+            with dot notation) to values
+        """
         config = self.data.copy()
 
-        # Support nested keys like "profiles.default.name"
-        keys = key.split(".")
-        current = config
-        for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            elif not isinstance(current[k], dict):
-                # If the intermediate key exists but is not a dict, we can't traverse further
-                current_type = type(current[k]).__name__
-                raise ValueError(
-                    f"Cannot set nested key '{key}': '{k}' is a {current_type}, not a dictionary"
-                )
-            current = current[k]
+        for key, value in values.items():
+            # Support nested keys like "profiles.default.name"
+            keys = key.split(".")
+            current = config
+            for k in keys[:-1]:
+                if k not in current:
+                    current[k] = {}
+                elif not isinstance(current[k], dict):
+                    # If the intermediate key exists but is not a dict, we can't traverse further
+                    current_type = type(current[k]).__name__
+                    raise ValueError(
+                        f"Cannot set nested key '{key}': '{k}' is a {current_type}, not a dictionary"
+                    )
+                current = current[k]
+
+            current[keys[-1]] = value
 
-        current[keys[-1]] = value
         self._save(config)
 
     # Commonly used properties for easy access
@@ -212,37 +256,14 @@ class PBIConfig:
         """Set the default output folder.
 
         Handles Windows paths with backslashes and shell escaping issues by:
-        1. Converting to raw string representation
-        2. Stripping any escaped quotes
-        3. Normalizing the path using pathlib
+        1. Stripping surrounding quotes, including a trailing quote left over
+           from an escaped ``\\"`` at the end of the path
+        2. Expanding ``~`` and making the path absolute with os.path
 
         :param value: Path to the default output folder
         """
         if value is not None:
-            # Handle shell escaping issues: if value ends with \", the quote is escaped
-            # We need to strip trailing quotes that were escaped by backslashes
-            # Use repr/eval to handle raw string conversion safely
-            try:
-                # If the string ends with an escaped quote, remove it
-                if value.endswith('\\"') or value.endswith("\\'"):
-                    value = value[:-1]  # Remove the escaped quote
-                elif value.endswith('"') or value.endswith("'"):
-                    # Check if it's a legitimate quote or an escaped one
-                    if len(value) > 1 and value[-2] != "\\":
-                        value = value[:-1]  # Strip unescaped trailing quote
-            except Exception:
-                pass  # If anything goes wrong, use the value as-is
-
-            # Strip leading quotes if present
-            if (value.startswith('"') and not value.startswith('\\"')) or (
-                value.startswith("'") and not value.startswith("\\'")
-            ):
-                value = value[1:]
-
-            # Expand user home directory if needed and convert to absolute path
-            # pathlib handles path normalization across platforms
-            path = Path(value).expanduser().absolute()
-            self.set("default_output_folder", str(path))
+            self.set("default_output_folder", _sanitize_local_path(value))
         else:
             self.set("default_output_folder", None)
 
@@ -264,6 +285,9 @@ class PBIConfig:
         :param value: Path to the cache folder (local or cloud)
         """
         if value is not None:
+            # Strip shell quotes from both ends in a single pass
+            value = value.strip("\"'")
+
             # Check if it's a cloud path
             is_cloud_path = any(
                 value.startswith(prefix)
@@ -271,29 +295,11 @@ class PBIConfig:
             )
 
             if is_cloud_path:
-                # For cloud paths, just strip quotes and store as-is
-                value = value.strip('"').strip("'")
+                # Cloud paths are stored as-is
                 self.set("cache_folder", value)
             else:
-                # For local paths, handle shell escaping and normalize
-                try:
-                    if value.endswith('\\"') or value.endswith("\\'"):
-                        value = value[:-1]
-                    elif value.endswith('"') or value.endswith("'"):
-                        if len(value) > 1 and value[-2] != "\\":
-                            value = value[:-1]
-                except Exception:
-                    pass
-
-                # Strip leading quotes if present
-                if (value.startswith('"') and not value.startswith('\\"')) or (
-                    value.startswith("'") and not value.startswith("\\'")
-                ):
-                    value = value[1:]
-
                 # Expand user home directory and convert to absolute path
-                path = Path(value).expanduser().absolute()
-                self.set("cache_folder", str(path))
+                self.set("cache_folder", _sanitize_local_path(value))
         else:
             self.set("cache_folder", None)
 
@@ -483,8 +489,12 @@ def migrate_legacy_config():
         try:
             with open(LEGACY_PROFILES_FILE, "r", encoding="utf-8") as fp:
                 profiles_data = json.load(fp)
-                pbi_config.active_profile = profiles_data.get("active_profile")
-                pbi_config.profiles = profiles_data.get("profiles", {})
+                pbi_config.update(
+                    {
+                        "active_profile": profiles_data.get("active_profile"),
+                        "profiles": profiles_data.get("profiles", {}),
+                    }
+                )
                 migrated = True
                 logger.info("Migrated profiles from JSON to YAML")
         except Exception as e:
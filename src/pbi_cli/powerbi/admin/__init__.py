@@ -1,7 +1,6 @@
 from functools import cached_property
 from typing import List, Literal, Optional
 
-import pandas as pd
 from loguru import logger
 
 from pbi_cli.powerbi.base import Base
@@ -1,7 +1,5 @@
 from pathlib import Path
 
-import pandas as pd
-
 
 def multi_group_dict_to_excel(data: dict, target: Path):
     """
@@ -18,6 +16,8 @@ def multi_group_dict_to_excel(data: dict, target: Path):
     :param data: A dictionary where each key maps to a list of dictionaries or data.
     :param file_name: Name of the Excel file to save
     """
+    import pandas as pd
+
     with pd.ExcelWriter(target, engine="openpyxl") as writer:
         for sheet_name, rows in data.items():
             df = pd.json_normalize(rows)
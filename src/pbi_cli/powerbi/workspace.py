@@ -2,7 +2,6 @@ import time
 from pathlib import Path
 from typing import Optional
 
-import pandas as pd
 from loguru import logger
 
 import pbi_cli.powerbi.admin.report as powerbi_admin_report
@@ -44,6 +43,8 @@ class Workspaces(Base):
                 "Please provide an Excel file (.xlsx or .xls)."
             )
 
+        import pandas as pd
+
         return pd.read_excel(cache_excel, sheet_name=None)
 
     @property
@@ -68,6 +69,8 @@ class Workspaces(Base):
                 "No cache data available. Please provide a valid cache file."
             )
 
+        import pandas as pd
+
         df_reports = self.cache.get("reports", pd.DataFrame())
 
         if workspace_types is not None:
@@ -199,6 +202,8 @@ class Workspaces(Base):
                 "Please provide an Excel file (.xlsx or .xls)."
             )
 
+        import pandas as pd
+
         with pd.ExcelWriter(target_path) as writer:
             for sheet_name, df in self.cache.items():
                 df.to_excel(writer, sheet_name=sheet_name, index=False)
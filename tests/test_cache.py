@@ -1,8 +1,6 @@
 """Tests for cache functionality."""
 
 import json
-import shutil
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -10,13 +8,18 @@ import pytest
 from pbi_cli.cache import CacheConfig, CacheManager
 
 
+@pytest.fixture(scope="session")
+def _session_cache_root(tmp_path_factory) -> Path:
+    """Create one temporary root folder shared by all cache tests."""
+    return tmp_path_factory.mktemp("cache")
+
+
 @pytest.fixture
-def temp_cache_dir():
-    """Create a temporary cache directory."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    # Cleanup
-    shutil.rmtree(temp_dir)
+def temp_cache_dir(_session_cache_root, request) -> Path:
+    """Create a temporary cache directory for a single test."""
+    temp_dir = _session_cache_root / request.node.name
+    temp_dir.mkdir()
+    return temp_dir
 
 
 def test_cache_config_initialization():
@@ -168,3 +171,227 @@ def test_cache_structure(temp_cache_dir):
         assert "version" in data
         assert "data" in data
         assert "metadata" in data
+
+
+def test_cache_freshness(temp_cache_dir):
+    """Test freshness checks based on the version timestamp."""
+    from datetime import timedelta
+
+    manager = CacheManager(cache_folder=str(temp_cache_dir))
+
+    assert manager.is_fresh("test_key", timedelta(hours=1)) is False
+
+    version = manager.save("test_key", {"data": 1})
+    # Age the entry by renaming its version folder to an old timestamp
+    (temp_cache_dir / "test_key" / version).rename(
+        temp_cache_dir / "test_key" / "20000101_000000"
+    )
+
+    assert manager.is_fresh("test_key", timedelta(hours=1)) is False
+    assert manager.load("test_key", max_age=timedelta(hours=1)) is None
+    assert manager.load("test_key")["data"] == {"data": 1}
+
+    manager.save("test_key", {"data": 2})
+
+    assert manager.is_fresh("test_key", timedelta(hours=1)) is True
+    assert manager.load("test_key", max_age=timedelta(hours=1))["data"] == {"data": 2}
+
+
+def test_cache_prune(temp_cache_dir):
+    """Test pruning expired cache versions."""
+    from datetime import timedelta
+
+    manager = CacheManager(cache_folder=str(temp_cache_dir))
+
+    old_versions = ["20000101_000000", "20000102_000000"]
+    for old_version in old_versions:
+        version = manager.save("test_key", {"data": old_version})
+        (temp_cache_dir / "test_key" / version).rename(
+            temp_cache_dir / "test_key" / old_version
+        )
+    # Versions that are not timestamps are never pruned
+    manual = manager.save("test_key", {"data": "manual"})
+    (temp_cache_dir / "test_key" / manual).rename(
+        temp_cache_dir / "test_key" / "manual"
+    )
+    latest = manager.save("test_key", {"data": "latest"})
+
+    removed = manager.prune(timedelta(days=1))
+
+    assert removed == 2
+    assert manager.list_versions("test_key") == [latest, "manual"]
+    assert manager.is_fresh("test_key", timedelta(days=1)) is True
+    assert not (temp_cache_dir / "test_key" / old_versions[0]).exists()
+
+
+def test_cache_prune_keeps_latest(temp_cache_dir):
+    """Test that pruning keeps the latest version unless asked otherwise."""
+    from datetime import timedelta
+
+    manager = CacheManager(cache_folder=str(temp_cache_dir))
+
+    version = manager.save("test_key", {"data": 1})
+    (temp_cache_dir / "test_key" / version).rename(
+        temp_cache_dir / "test_key" / "20000101_000000"
+    )
+
+    assert manager.prune(timedelta(days=1), cache_key="test_key") == 0
+    assert manager.list_versions("test_key") == ["20000101_000000"]
+
+    assert manager.prune(timedelta(days=1), keep_latest=False) == 1
+    assert manager.list_versions("test_key") == []
+
+
+def test_cache_zstd_compression(temp_cache_dir):
+    """Test saving and loading zstd-compressed cache files."""
+    pytest.importorskip("zstandard")
+    config = CacheConfig(cache_folder=str(temp_cache_dir), compression="zstd")
+    manager = CacheManager(config=config)
+
+    version = manager.save("test_key", {"value": [1, 2, 3]})
+
+    cache_dir = temp_cache_dir / "test_key" / version
+    assert (cache_dir / "test_key.json.zst").exists()
+    assert not (cache_dir / "test_key.json").exists()
+    assert manager.list_versions("test_key") == [version]
+    assert manager.load("test_key")["data"] == {"value": [1, 2, 3]}
+
+    manager.clear("test_key", version)
+    assert manager.load("test_key") is None
+
+
+def test_cache_unknown_compression():
+    """Test that unsupported compression values are rejected."""
+    with pytest.raises(ValueError):
+        CacheConfig(compression="gzip")
+
+
+def test_cache_skip_unchanged(temp_cache_dir):
+    """Test that unchanged data does not create a new version."""
+    manager = CacheManager(cache_folder=str(temp_cache_dir))
+
+    version = manager.save("test_key", {"data": 1}, skip_unchanged=True)
+    # Give the entry an old timestamp so a new version would get a new folder
+    (temp_cache_dir / "test_key" / version).rename(
+        temp_cache_dir / "test_key" / "20000101_000000"
+    )
+
+    assert manager.save("test_key", {"data": 1}, skip_unchanged=True) == (
+        "20000101_000000"
+    )
+    assert manager.list_versions("test_key") == ["20000101_000000"]
+
+    changed = manager.save(
+        "test_key", {"data": 1}, metadata={"top": 10}, skip_unchanged=True
+    )
+    assert changed != "20000101_000000"
+    assert manager.list_versions("test_key") == [changed, "20000101_000000"]
+
+
+def test_cache_skip_unchanged_confirms_freshness(temp_cache_dir):
+    """Test that re-fetching unchanged data counts towards freshness."""
+    from datetime import timedelta
+
+    from loguru import logger
+
+    manager = CacheManager(cache_folder=str(temp_cache_dir))
+
+    version = manager.save("test_key", {"data": 1}, skip_unchanged=True)
+    (temp_cache_dir / "test_key" / version).rename(
+        temp_cache_dir / "test_key" / "20000101_000000"
+    )
+    assert manager.is_fresh("test_key", timedelta(hours=1)) is False
+    assert manager.load("test_key", max_age=timedelta(hours=1)) is None
+
+    messages = []
+    handler_id = logger.add(messages.append, level="INFO")
+    try:
+        manager.save("test_key", {"data": 1}, skip_unchanged=True)
+    finally:
+        logger.remove(handler_id)
+    # The previous payload is compared by hash, without loading it
+    assert not any("Loaded cache" in message for message in messages)
+
+    assert manager.is_fresh("test_key", timedelta(hours=1)) is True
+    loaded = manager.load(
+        "test_key", max_age=timedelta(hours=1), include_confirmed_at=True
+    )
+    assert loaded["data"] == {"data": 1}
+    assert "confirmed_at" in loaded
+    # The state file is only read when the caller asks for confirmed_at
+    assert "confirmed_at" not in manager.load("test_key")
+
+    # Recently confirmed versions are not pruned, even if they have old names
+    assert manager.prune(timedelta(hours=1), keep_latest=False) == 0
+    assert manager.list_versions("test_key") == ["20000101_000000"]
+
+
+@pytest.mark.parametrize(
+    "state", [b'{"confirmed_at": "garbage"}', b'{"confirmed_at": 1}', b"[1]"]
+)
+def test_cache_prune_corrupt_state(temp_cache_dir, state):
+    """Test that a corrupt state file leaves the entry unconfirmed."""
+    from datetime import timedelta
+
+    manager = CacheManager(cache_folder=str(temp_cache_dir))
+
+    version = manager.save("test_key", {"data": 1}, skip_unchanged=True)
+    version_dir = temp_cache_dir / "test_key" / "20000101_000000"
+    (temp_cache_dir / "test_key" / version).rename(version_dir)
+    (version_dir / "test_key.state.json").write_bytes(state)
+
+    assert manager.is_fresh("test_key", timedelta(hours=1)) is False
+    assert manager.prune(timedelta(hours=1), keep_latest=False) == 1
+    assert manager.list_versions("test_key") == []
+
+
+def test_cache_json_backends_match(monkeypatch):
+    """Test that orjson and the standard library write the same cache format."""
+    pytest.importorskip("orjson")
+    import pbi_cli.cache as cache_module
+
+    data = {"value": [{"id": "123", "name": "Café", "size": 2.5, "tags": []}]}
+
+    orjson_bytes = cache_module._dumps(data)
+    monkeypatch.setattr(cache_module, "ORJSON_AVAILABLE", False)
+    stdlib_bytes = cache_module._dumps(data)
+
+    assert orjson_bytes == stdlib_bytes
+    assert cache_module._loads(orjson_bytes) == data
+
+
+def test_cache_json_orjson_fallback():
+    """Test that values orjson rejects are handled by the standard library."""
+    pytest.importorskip("orjson")
+    import math
+
+    import pbi_cli.cache as cache_module
+
+    big = {"value": 2**70}
+    assert cache_module._loads(cache_module._dumps(big)) == big
+
+    # Files written by json.dumps may contain NaN, which orjson cannot read
+    loaded = cache_module._loads(json.dumps({"value": float("nan")}).encode())
+    assert math.isnan(loaded["value"])
+
+
+def test_cache_zstd_missing_dependency(temp_cache_dir, monkeypatch):
+    """Test that reading a compressed entry without zstandard logs a clear error."""
+    from loguru import logger
+
+    import pbi_cli.cache as cache_module
+
+    version_dir = temp_cache_dir / "test_key" / "20240101_120000"
+    version_dir.mkdir(parents=True)
+    (version_dir / "test_key.json.zst").write_bytes(b"compressed")
+    monkeypatch.setattr(cache_module, "ZSTD_AVAILABLE", False)
+
+    messages = []
+    handler_id = logger.add(messages.append, level="ERROR")
+    try:
+        loaded = CacheManager(cache_folder=str(temp_cache_dir)).load("test_key")
+    finally:
+        logger.remove(handler_id)
+
+    assert loaded is None
+    assert any("zstandard is required" in message for message in messages)
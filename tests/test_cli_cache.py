@@ -0,0 +1,91 @@
+"""Tests for cache CLI commands."""
+
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from pbi_cli.cache import CacheManager
+from pbi_cli.cli import pbi
+from pbi_cli.config import PBIConfig
+
+
+def _cache_runner(tmp_path, monkeypatch) -> CliRunner:
+    """Return a CliRunner with HOME and the cache folder inside *tmp_path*."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config = PBIConfig(config_file=tmp_path / ".pbi_cli" / "config.yaml")
+    config.cache_folder = str(tmp_path / "cache")
+    return CliRunner()
+
+
+def _save_old_version(manager: CacheManager, cache_key: str, version: str):
+    """Save data and move it to an old version folder."""
+    saved = manager.save(cache_key, {"version": version})
+    cache_dir = Path(manager.config.cache_folder) / cache_key
+    (cache_dir / saved).rename(cache_dir / version)
+
+
+def test_cache_prune_removes_old_versions(tmp_path, monkeypatch):
+    """Test that cache prune removes old versions but keeps the latest one."""
+    runner = _cache_runner(tmp_path, monkeypatch)
+    manager = CacheManager(cache_folder=str(tmp_path / "cache"))
+    _save_old_version(manager, "workspaces", "20000101_000000")
+    _save_old_version(manager, "workspaces", "manual")
+    latest = manager.save("workspaces", {"version": "latest"})
+
+    result = runner.invoke(pbi, ["cache", "prune", "--older-than", "30", "--yes"])
+
+    assert result.exit_code == 0, result.output
+    assert "Removed 1 cached version(s)" in result.output
+    assert manager.list_versions("workspaces") == [latest, "manual"]
+
+
+def test_cache_prune_keeps_newest_timestamp_version(tmp_path, monkeypatch):
+    """Test that the kept version is the newest timestamp, not another name."""
+    runner = _cache_runner(tmp_path, monkeypatch)
+    manager = CacheManager(cache_folder=str(tmp_path / "cache"))
+    _save_old_version(manager, "workspaces", "20000101_000000")
+    _save_old_version(manager, "workspaces", "20000102_000000")
+    _save_old_version(manager, "workspaces", "manual")
+
+    result = runner.invoke(pbi, ["cache", "prune", "--older-than", "1", "--yes"])
+
+    assert result.exit_code == 0, result.output
+    assert manager.list_versions("workspaces") == ["20000102_000000", "manual"]
+
+
+def test_cache_prune_large_older_than(tmp_path, monkeypatch):
+    """Test that very large --older-than values remove nothing or are rejected."""
+    runner = _cache_runner(tmp_path, monkeypatch)
+    manager = CacheManager(cache_folder=str(tmp_path / "cache"))
+    _save_old_version(manager, "workspaces", "20000101_000000")
+    manager.save("workspaces", {"version": "latest"})
+
+    result = runner.invoke(pbi, ["cache", "prune", "--older-than", "1000000", "--yes"])
+    assert result.exit_code == 0, result.output
+    assert "Removed 0 cached version(s)" in result.output
+    assert len(manager.list_versions("workspaces")) == 2
+
+    result = runner.invoke(
+        pbi, ["cache", "prune", "--older-than", "1000000000000", "--yes"]
+    )
+    assert result.exit_code == 2
+    assert "Invalid value" in result.output
+
+
+def test_cache_load_reports_confirmation_time(tmp_path, monkeypatch):
+    """Test that cached data confirmed by a re-fetch reports the confirmation time."""
+    runner = _cache_runner(tmp_path, monkeypatch)
+    manager = CacheManager(cache_folder=str(tmp_path / "cache"))
+    data = {"value": [{"id": "123", "name": "Test"}]}
+    saved = manager.save("workspaces", data, skip_unchanged=True)
+    cached_at = manager.load("workspaces")["cached_at"]
+    cache_dir = tmp_path / "cache" / "workspaces"
+    (cache_dir / saved).rename(cache_dir / "20000101_000000")
+    manager.save("workspaces", data, skip_unchanged=True)
+    confirmed_at = manager.load("workspaces", include_confirmed_at=True)["confirmed_at"]
+
+    result = runner.invoke(pbi, ["workspaces", "list", "--cache-only"])
+
+    assert result.exit_code == 0, result.output
+    assert f"Using cached data from {confirmed_at}" in result.output
+    assert cached_at != confirmed_at
@@ -0,0 +1,36 @@
+"""Tests for users CLI commands."""
+
+import json
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from pbi_cli.cli import pbi
+
+
+def test_user_access_writes_json_to_target_folder(tmp_path, monkeypatch):
+    """Test that user-access writes the result to --target-folder."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    fake_response = {"value": [{"id": "workspace-1", "accessRight": "Admin"}]}
+    target_folder = tmp_path / "out"
+
+    runner = CliRunner()
+    with patch("pbi_cli.cli.load_auth", return_value={"Authorization": "Bearer test"}):
+        with patch("pbi_cli.cli.User") as mock_user:
+            mock_user.return_value.return_value = fake_response
+            result = runner.invoke(
+                pbi,
+                [
+                    "users",
+                    "user-access",
+                    "--user-id",
+                    "Jane.Doe@example.com",
+                    "--target-folder",
+                    str(target_folder),
+                ],
+            )
+
+    assert result.exit_code == 0, result.output
+    json_file = target_folder / "jane-doe-example-com.json"
+    assert json_file.exists()
+    assert json.loads(json_file.read_text()) == fake_response
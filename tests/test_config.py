@@ -0,0 +1,59 @@
+"""Tests for PBIConfig reading and writing."""
+
+import yaml
+
+from pbi_cli.config import PBIConfig
+
+
+def test_config_update_sets_multiple_keys(tmp_path):
+    """Test that update() sets several keys, including nested ones."""
+    config_file = tmp_path / "config.yaml"
+    config = PBIConfig(config_file=config_file)
+
+    config.update(
+        {
+            "active_profile": "prod",
+            "profiles": {"prod": {"name": "prod"}},
+            "custom.setting": "value",
+        }
+    )
+
+    reloaded = PBIConfig(config_file=config_file)
+    assert reloaded.active_profile == "prod"
+    assert reloaded.profiles == {"prod": {"name": "prod"}}
+    assert reloaded.get("custom.setting") == "value"
+
+
+def test_config_reads_external_changes(tmp_path):
+    """Test that edits made outside PBIConfig are picked up."""
+    config_file = tmp_path / "config.yaml"
+    PBIConfig(config_file=config_file).active_profile = "first"
+    assert PBIConfig(config_file=config_file).active_profile == "first"
+
+    with open(config_file, "w", encoding="utf-8") as fp:
+        yaml.dump({"active_profile": "second-profile"}, fp)
+
+    assert PBIConfig(config_file=config_file).active_profile == "second-profile"
+
+
+def test_config_data_is_not_shared_between_instances(tmp_path):
+    """Test that mutating one instance's data does not leak into another."""
+    config_file = tmp_path / "config.yaml"
+    PBIConfig(config_file=config_file).add_profile("prod")
+
+    first = PBIConfig(config_file=config_file)
+    first.data["profiles"]["prod"]["name"] = "changed"
+
+    second = PBIConfig(config_file=config_file)
+    assert second.profiles["prod"]["name"] == "prod"
+
+
+def test_cache_folder_strips_quotes(tmp_path):
+    """Test that shell quotes are stripped from local and cloud cache folders."""
+    config = PBIConfig(config_file=tmp_path / "config.yaml")
+
+    config.cache_folder = '"s3://bucket/cache"'
+    assert config.cache_folder == "s3://bucket/cache"
+
+    config.cache_folder = f"'{tmp_path / 'cache'}'"
+    assert config.cache_folder == str(tmp_path / "cache")